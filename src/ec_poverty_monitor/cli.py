@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import os
 import subprocess
 import sys
@@ -9,6 +8,7 @@ from pathlib import Path
 import typer
 
 from ec_poverty_monitor.pipeline import run_pipeline
+from ec_poverty_monitor.util.jsonio import dumps_indented
 
 app = typer.Typer(add_completion=False, invoke_without_command=True)
 
@@ -30,7 +30,7 @@ def main(
     if config is None:
         raise typer.BadParameter("--config is required")
     result = run_pipeline(config_path=config, force=force)
-    typer.echo(json.dumps(result, indent=2, ensure_ascii=False))
+    typer.echo(dumps_indented(result).decode("utf-8"))
 
 
 @app.command()
@@ -45,7 +45,7 @@ def run(
 ) -> None:
     """Run the pipeline (compat command)."""
     result = run_pipeline(config_path=config, force=force)
-    typer.echo(json.dumps(result, indent=2, ensure_ascii=False))
+    typer.echo(dumps_indented(result).decode("utf-8"))
 
 
 @app.command()
@@ -8,6 +8,38 @@ import duckdb
 import pandas as pd
 import streamlit as st
 
+
+_VIEW_SQL = """
+SELECT
+    period_date, series, value, unit, source,
+    coalesce(comparability_break, false) AS comparability_break
+FROM mart_indicators
+WHERE series = ANY(?)
+ORDER BY series, period_date
+"""
+
+
+# Connections are opened per query and closed straight away: an open read-only
+# connection holds the file lock and would block the pipeline from rebuilding the mart.
+@st.cache_data(show_spinner=False)
+def load_series_list(path: str, mtime: float) -> list[str]:
+    """Distinct series names; ``mtime`` keys the cache so a rebuilt mart is reloaded."""
+    with duckdb.connect(path, read_only=True) as con:
+        return (
+            con.execute(
+                "SELECT series FROM mart_indicators WHERE series IS NOT NULL GROUP BY series ORDER BY series"
+            )
+            .df()["series"]
+            .tolist()
+        )
+
+
+@st.cache_data(show_spinner=False)
+def load_view(path: str, mtime: float, selected: tuple[str, ...]) -> pd.DataFrame:
+    with duckdb.connect(path, read_only=True) as con:
+        return con.execute(_VIEW_SQL, [list(selected)]).df()
+
+
 st.set_page_config(page_title="Ecuador Economy & Poverty Monitor", layout="wide")
 
 st.title("Ecuador Economy & Poverty Monitor")
@@ -47,24 +79,19 @@ if not duckdb_file.exists():
         st.stop()
 
 try:
-    con = duckdb.connect(duckdb_path, read_only=True)
-    indicators = con.execute("SELECT * FROM mart_indicators").df()
-    con.close()
+    duckdb_mtime = duckdb_file.stat().st_mtime
+    series_list = load_series_list(duckdb_path, duckdb_mtime)
 except Exception:
     st.info("Run the pipeline first: `poetry run ecmon --config config/config.yaml`")
     st.stop()
 
-if indicators.empty:
+if not series_list:
     st.warning("No indicators found in mart_indicators.")
     st.stop()
 
-indicators["period_date"] = pd.to_datetime(indicators["period_date"])
-
-series_list = sorted(indicators["series"].dropna().unique().tolist())
 selected = st.multiselect("Series", options=series_list, default=series_list[:1])
 
-view = indicators[indicators["series"].isin(selected)].copy()
-view = view.sort_values(["series", "period_date"])
+view = load_view(duckdb_path, duckdb_mtime, tuple(selected))
 
 units = (
     view[["series", "unit"]]
@@ -85,10 +112,11 @@ else:
 break_start = pd.to_datetime(dt.date(2020, 1, 1))
 break_end = pd.to_datetime(dt.date(2021, 5, 31))
 
-if "comparability_break" in view.columns and view["comparability_break"].fillna(False).any():
+if view["comparability_break"].any():
     st.warning("Selected data includes the ENEMDU comparability window (2020–May 2021).")
 
-base = alt.Chart(view).encode(
+# Streamlit ships chart data to the browser as Arrow; send only the encoded columns.
+base = alt.Chart(view[["period_date", "series", "value", "unit", "source"]]).encode(
     x=alt.X("period_date:T", title="Date"),
     y=alt.Y("value:Q", title=y_title),
     color=alt.Color("series:N", title="Series"),
@@ -1,29 +1,36 @@
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
-import json
+import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, TypeVar
 
 import pandas as pd
 
 from ec_poverty_monitor.settings import Settings, load_settings
 from ec_poverty_monitor.sources.inec_labor import run_inec_labor
 from ec_poverty_monitor.sources.inec_poverty import run_inec_poverty
-from ec_poverty_monitor.sources.pip import run_pip
-from ec_poverty_monitor.sources.wdi import run_wdi
+from ec_poverty_monitor.sources.pip import arun_pip
+from ec_poverty_monitor.sources.wdi import arun_wdi
 from ec_poverty_monitor.transform.marts import (
     MartResult,
-    apply_comparability_break,
     build_duckdb_and_parquet,
-    canonicalize_period,
+    enrich,
     stack_sources,
 )
 from ec_poverty_monitor.util.fs import ensure_dirs
+from ec_poverty_monitor.util.http import async_http_client
+from ec_poverty_monitor.util.jsonio import dumps_indented
 from ec_poverty_monitor.util.logging import configure_logging
 from ec_poverty_monitor.validate import validate_indicators
 
+# Low-cardinality string columns; stored as categoricals (DuckDB ENUMs in the marts).
+_INDICATOR_CATEGORICALS = ("series", "unit", "source", "period_grain")
+
+T = TypeVar("T")
+
 
 @dataclass(frozen=True)
 class PipelineResult:
@@ -35,6 +42,37 @@ class PipelineResult:
     sources_rows: int
 
 
+async def _run_source(logger: logging.Logger, name: str, aw: Awaitable[T]) -> T:
+    logger.info("%s.start", name)
+    out = await aw
+    logger.info("%s.finish", name)
+    return out
+
+
+async def _run_sources(
+    settings: Settings, logger: logging.Logger, *, country: str, force: bool
+) -> list[Any]:
+    # Sources are independent and network-bound; fetch them concurrently on one event loop.
+    # The INEC sources also parse workbooks and HTML, so they run in worker threads.
+    # WDI and PIP share one async client.
+    wp = settings.sources.get("inec_wp_api", {})
+    async with async_http_client(
+        user_agent=str(wp.get("user_agent", "ec-pov-monitor")), timeout_s=float(wp.get("timeout_s", 60))
+    ) as client:
+        return await asyncio.gather(
+            _run_source(logger, "inec_labor", asyncio.to_thread(run_inec_labor, settings.sources)),
+            _run_source(
+                logger,
+                "inec_poverty",
+                asyncio.to_thread(
+                    run_inec_poverty, settings.sources, cache_dir=settings.paths.data_raw, force=force
+                ),
+            ),
+            _run_source(logger, "wdi", arun_wdi(settings.sources, country=country, client=client)),
+            _run_source(logger, "pip", arun_pip(settings.sources, client=client)),
+        )
+
+
 def run_pipeline(config_path: Path, force: bool = False) -> dict[str, Any]:
     settings: Settings = load_settings(config_path)
     ensure_dirs(settings)
@@ -45,27 +83,27 @@ def run_pipeline(config_path: Path, force: bool = False) -> dict[str, Any]:
 
     country = str(settings.project.get("country_iso3", "ECU"))
 
-    labor = run_inec_labor(settings.sources)
-    poverty = run_inec_poverty(settings.sources, cache_dir=settings.paths.data_raw, force=force)
-    wdi = run_wdi(settings.sources, country=country)
-    pip = run_pip(settings.sources)
+    labor, poverty, wdi, pip = asyncio.run(_run_sources(settings, logger, country=country, force=force))
 
     frames = [labor.indicators, poverty.indicators, wdi.indicators, pip.indicators]
     indicators = pd.concat([df for df in frames if df is not None and not df.empty], ignore_index=True)
+    for col in _INDICATOR_CATEGORICALS:
+        if col in indicators.columns:
+            indicators[col] = indicators[col].astype("category")
 
     if not indicators.empty:
-        indicators = canonicalize_period(indicators)
-
         # Comparability window (used mainly for INEC ENEMDU-derived indicators)
         start = dt.date.fromisoformat(settings.comparability.enemdu_break.start)
         end = dt.date.fromisoformat(settings.comparability.enemdu_break.end)
-        indicators = apply_comparability_break(indicators, start=start, end=end)
+        indicators = enrich(indicators, start=start, end=end)
 
     issues = validate_indicators(indicators)
     if issues:
         logger.warning("pipeline.validation_issues", extra={"issues": issues})
 
     sources = stack_sources([labor.sources, poverty.sources, wdi.sources, pip.sources])
+    if "source" in sources.columns:
+        sources["source"] = sources["source"].astype("category")
 
     # Write marts via DuckDB
     duckdb_path = str(settings.paths.duckdb_path)
@@ -97,7 +135,7 @@ def run_pipeline(config_path: Path, force: bool = False) -> dict[str, Any]:
     }
 
     manifest_path = settings.paths.runs / f"run_{started.strftime('%Y%m%dT%H%M%SZ')}.json"
-    manifest_path.write_text(json.dumps(manifest, indent=2, ensure_ascii=False))
+    manifest_path.write_bytes(dumps_indented(manifest))
 
     logger.info(
         "pipeline.finish",
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader
+
 
 @dataclass(frozen=True)
 class Paths:
@@ -38,7 +44,14 @@ class Settings:
 
 
 def load_settings(config_path: Path) -> Settings:
-    cfg = yaml.safe_load(config_path.read_text())
+    # Keyed on mtime so an edited config is re-read.
+    path = Path(config_path)
+    return _load_settings(str(path), path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_settings(config_path: str, mtime_ns: int) -> Settings:
+    cfg = yaml.load(Path(config_path).read_text(), Loader=_Loader)
 
     paths = Paths(
         data_raw=Path(cfg["paths"]["data_raw"]),
@@ -1,14 +1,22 @@
 from __future__ import annotations
 
 import datetime as dt
+import math
+import multiprocessing
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import Any
 
+import lxml.html
+import numpy as np
 import pandas as pd
+from lxml import etree
 
 from ec_poverty_monitor.sources.inec_wp import WpPost, extract_urls, fetch_posts_multi
-from ec_poverty_monitor.util.text import parse_float_maybe
+from ec_poverty_monitor.util.dedup import keep_last_sorted
+from ec_poverty_monitor.util.text import parse_float_array
 
 
 @dataclass(frozen=True)
@@ -32,13 +40,28 @@ _MONTH_ABBR = {
     "dic": 12,
 }
 
+_PERIOD_RE = re.compile(r"^([a-z]{3})\s*-\s*(\d{2}|\d{4})$")
+
+# Normalize indicator names.
+_INDICATORS = {
+    "tasa de desempleo": "unemployment_rate_pct",
+    "tasa de empleo adecuado": "adequate_employment_rate_pct",
+    "tasa de subempleo": "underemployment_rate_pct",
+}
+# Spawned workers re-import pandas/numpy/lxml (~0.8 s each) while a post parses in ~15 ms,
+# so the pool only pays off for large batches on more than one CPU.
+_MIN_POSTS_FOR_POOL = 128
+_POSTS_PER_CHUNK = 4
+
+_INDICATOR_PATTERN = "(" + "|".join(re.escape(k) for k in _INDICATORS) + ")"
+
 
 def _parse_period(col: str) -> dt.date | None:
     s = str(col).strip().lower()
     s = s.replace("–", "-").replace("—", "-")
 
     # Formats observed: "oct-25", "oct-2025", sometimes with spaces.
-    m = re.match(r"^([a-z]{3})\s*-\s*(\d{2}|\d{4})$", s)
+    m = _PERIOD_RE.match(s)
     if not m:
         return None
 
@@ -58,75 +81,164 @@ def _parse_period(col: str) -> dt.date | None:
     return next_month - dt.timedelta(days=1)
 
 
-def _pick_indicator_table(tables: list[pd.DataFrame]) -> pd.DataFrame | None:
-    for t in tables:
-        if t.empty:
-            continue
-        first_col = t.columns[0]
-        values = t[first_col].astype(str).str.lower()
-        if values.str.contains("tasa de desempleo").any() and values.str.contains("tasa de empleo adecuado").any():
-            return t
-    return None
+def _cell_text(cell: lxml.html.HtmlElement) -> str:
+    return " ".join(cell.text_content().split())
 
 
-def extract_labor_from_posts(posts: list[WpPost]) -> LaborExtract:
-    rows: list[dict[str, Any]] = []
-    sources: list[dict[str, Any]] = []
-
-    for post in posts:
-        html = post.content_html
-        try:
-            tables = pd.read_html(html)
-        except ValueError:
-            continue
+def _is_indicator_table(trs: list[lxml.html.HtmlElement]) -> bool:
+    """Cheap check on the first column of at most 30 rows; bails early on tiny tables."""
+    # Only the row count is checked up front: the first row may be a colspan title.
+    if len(trs) < 2:
+        return False
+    first: list[str] = []
+    for tr in trs[:30]:
+        cells = tr.xpath("./th|./td")
+        if cells:
+            first.append(_cell_text(cells[0]).lower())
+    return any("tasa de desempleo" in v for v in first) and any(
+        "tasa de empleo adecuado" in v for v in first
+    )
 
-        table = _pick_indicator_table(tables)
-        if table is None:
+
+def _span(cell: lxml.html.HtmlElement, attr: str) -> int:
+    try:
+        return max(int(cell.get(attr, 1)), 1)
+    except ValueError:
+        return 1
+
+
+def _table_rows(trs: list[lxml.html.HtmlElement]) -> list[list[str]]:
+    """Cell texts per row, with colspans expanded and rowspans carried into the rows below."""
+    rows: list[list[str]] = []
+    # Column index -> (text, remaining rows) for cells spanning down from earlier rows.
+    carried: dict[int, tuple[str, int]] = {}
+
+    def take_carried(col: int, cells: list[str]) -> None:
+        text, left = carried.pop(col)
+        cells.append(text)
+        if left > 1:
+            carried[col] = (text, left - 1)
+
+    for tr in trs:
+        cells: list[str] = []
+        for cell in tr.xpath("./th|./td"):
+            while len(cells) in carried:
+                take_carried(len(cells), cells)
+            text = _cell_text(cell)
+            rowspan = _span(cell, "rowspan")
+            for _ in range(_span(cell, "colspan")):
+                if rowspan > 1:
+                    carried[len(cells)] = (text, rowspan - 1)
+                cells.append(text)
+        while carried and max(carried) >= len(cells):
+            if len(cells) in carried:
+                take_carried(len(cells), cells)
+            else:
+                cells.append("")
+        rows.append(cells)
+    return rows
+
+
+def _find_indicator_table(html: str) -> pd.DataFrame | None:
+    """Locate the ENEMDU indicator table and build it straight from the parsed tree.
+
+    The header is the first row with a period-like cell (e.g. "oct-25"); cells are kept as text.
+    """
+    if not html:
+        return None
+    try:
+        doc = lxml.html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return None
+
+    for t in doc.xpath("//table"):
+        trs = t.xpath("./tr|./thead/tr|./tbody/tr|./tfoot/tr")
+        if not _is_indicator_table(trs):
             continue
 
-        sources.append({"source": "INEC", "post_url": post.link, "post_date": post.date, "post_title": post.title})
+        rows = _table_rows(trs)
+        header_idx = next(
+            (i for i, r in enumerate(rows) if any(_parse_period(c) is not None for c in r[1:])),
+            None,
+        )
+        if header_idx is None:
+            continue
+        header = rows[header_idx]
+        body = [r for r in rows[header_idx + 1 :] if r]
+        if body:
+            # Build column by column; short rows are padded with empty cells.
+            table = pd.DataFrame(
+                {j: [r[j] if j < len(r) else "" for r in body] for j in range(len(header))}
+            )
+            table.columns = header
+            return table
+    return None
 
-        indicator_col = table.columns[0]
-        table[indicator_col] = table[indicator_col].astype(str)
 
-        # Normalize indicator names.
-        indicators = {
-            "tasa de desempleo": "unemployment_rate_pct",
-            "tasa de empleo adecuado": "adequate_employment_rate_pct",
-            "tasa de subempleo": "underemployment_rate_pct",
+def _table_to_long(table: pd.DataFrame) -> pd.DataFrame:
+    """Reshape the indicator rows of a post table into (series, period_date, value) rows."""
+    periods = [_parse_period(str(c)) for c in table.columns[1:]]
+    period_pos = [j for j, p in enumerate(periods, start=1) if p is not None]
+    if not period_pos:
+        return pd.DataFrame()
+
+    # First row matching each indicator name.
+    names = table.iloc[:, 0].astype(str).str.lower().reset_index(drop=True)
+    matched = names.str.extract(_INDICATOR_PATTERN, expand=False).map(_INDICATORS)
+    matched = matched.dropna().drop_duplicates()
+    if matched.empty:
+        return pd.DataFrame()
+
+    values = table.iloc[matched.index, period_pos].apply(parse_float_array)
+    values.columns = range(len(period_pos))
+    values.index = pd.Index(matched.to_numpy(), name="series")
+
+    long = values.melt(ignore_index=False, var_name="pos", value_name="value").dropna(subset=["value"])
+    period_dates = np.array([periods[j - 1] for j in period_pos], dtype="datetime64[ns]")
+    return pd.DataFrame(
+        {
+            "period_date": period_dates[long["pos"].to_numpy(dtype=int)],
+            "series": long.index.to_numpy(),
+            "value": long["value"].to_numpy(),
         }
+    )
+
+
+def _parse_one_post(post: WpPost) -> tuple[pd.DataFrame | None, dict[str, Any] | None]:
+    """Parse one post into its indicator rows and source record (None when no table matches)."""
+    table = _find_indicator_table(post.content_html)
+    if table is None:
+        return None, None
 
-        for raw_name, series in indicators.items():
-            mask = table[indicator_col].str.lower().str.contains(raw_name)
-            if not mask.any():
-                continue
-            r = table.loc[mask].iloc[0]
-
-            for col in table.columns[1:]:
-                period = _parse_period(str(col))
-                if period is None:
-                    continue
-                value = parse_float_maybe(r[col])
-                if value is None:
-                    continue
-
-                rows.append(
-                    {
-                        "period_date": period,
-                        "period_grain": "month",
-                        "series": series,
-                        "value": float(value),
-                        "unit": "%",
-                        "source": "INEC",
-                        "source_url": post.link,
-                    }
-                )
-
-    df = pd.DataFrame(rows)
+    source = {"source": "INEC", "post_url": post.link, "post_date": post.date, "post_title": post.title}
+
+    long = _table_to_long(table)
+    if long.empty:
+        return None, source
+    rows = long.assign(period_grain="month", unit="%", source="INEC", source_url=post.link)[
+        ["period_date", "period_grain", "series", "value", "unit", "source", "source_url"]
+    ]
+    return rows, source
+
+
+def extract_labor_from_posts(posts: list[WpPost]) -> LaborExtract:
+    workers = min(os.cpu_count() or 1, math.ceil(len(posts) / _POSTS_PER_CHUNK))
+    if len(posts) < _MIN_POSTS_FOR_POOL or workers < 2:
+        results = [_parse_one_post(p) for p in posts]
+    else:
+        # Parsing is CPU-bound and independent per post. This can run in a worker thread next to
+        # an event loop and logging threads, so workers are spawned rather than forked.
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as ex:
+            results = list(ex.map(_parse_one_post, posts, chunksize=_POSTS_PER_CHUNK))
+
+    frames = [rows for rows, _ in results if rows is not None]
+    sources = [source for _, source in results if source is not None]
+
+    df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
     if not df.empty:
-        df["period_date"] = pd.to_datetime(df["period_date"]).dt.date
-        df = df.drop_duplicates(subset=["period_date", "series"], keep="last")
-        df = df.sort_values(["series", "period_date"])
+        df = keep_last_sorted(df, keys=["period_date", "series"], order_by=["series", "period_date"])
 
     return LaborExtract(indicators=df, sources=sources)
 
@@ -153,4 +265,7 @@ def run_inec_labor(settings: dict[str, Any]) -> LaborExtract:
         if any(include.search(u) for u in urls) and not any(exclude.search(u) for u in urls):
             filtered.append(p)
 
+    # Release the HTML of posts we won't parse before the table extraction.
+    del posts
+
     return extract_labor_from_posts(filtered)
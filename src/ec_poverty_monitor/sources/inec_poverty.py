@@ -1,17 +1,22 @@
 from __future__ import annotations
 
 import datetime as dt
+import io
 import re
 import zipfile
 from dataclasses import dataclass
+from itertools import chain, islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
+import openpyxl
 import pandas as pd
 
 from ec_poverty_monitor.sources.inec_wp import WpPost, extract_urls, fetch_posts_multi
 from ec_poverty_monitor.util.http import download
-from ec_poverty_monitor.util.text import parse_float_maybe
+from ec_poverty_monitor.util.dedup import keep_last_sorted
+from ec_poverty_monitor.util.text import parse_float_array
 
 
 @dataclass(frozen=True)
@@ -36,6 +41,15 @@ _SPANISH_MONTH = {
     "diciembre": 12,
 }
 
+_QTR_RE = re.compile(r"^(\d{4})\s*Q([1-4])$")
+_ROMAN_RE = re.compile(r"^(\d{4})\s*(I{1,3}|IV)$")
+_FOOTNOTE_RE = re.compile(r"\([^)]*\)")
+_YEAR_RE = re.compile(r"\b(19\d{2}|20\d{2})\b")
+_WS_RE = re.compile(r"\s+")
+
+# Rows needed to locate the header ("Período" within the first 80) plus the 40-row year probe.
+_HEAD_ROWS = 120
+
 
 def _quarter_end(year: int, q: int) -> dt.date:
     if q == 1:
@@ -50,12 +64,12 @@ def _quarter_end(year: int, q: int) -> dt.date:
 def _parse_quarter_token(token: str) -> tuple[int, int] | None:
     s = str(token).strip().upper()
     s = s.replace("T", "Q")
-    m = re.match(r"^(\d{4})\s*Q([1-4])$", s)
+    m = _QTR_RE.match(s)
     if m:
         return int(m.group(1)), int(m.group(2))
 
     # Spanish roman numerals like "2023 II".
-    m2 = re.match(r"^(\d{4})\s*(I{1,3}|IV)$", s)
+    m2 = _ROMAN_RE.match(s)
     if m2:
         roman = m2.group(2)
         qmap = {"I": 1, "II": 2, "III": 3, "IV": 4}
@@ -65,34 +79,16 @@ def _parse_quarter_token(token: str) -> tuple[int, int] | None:
     return None
 
 
-def _month_end(year: int, month: int) -> dt.date:
-    if month == 12:
-        return dt.date(year, 12, 31)
-    return dt.date(year, month + 1, 1) - dt.timedelta(days=1)
+def _period_labels(col: pd.Series) -> pd.Series:
+    """Lower-cased, whitespace-normalized period labels; missing/blank cells become NaN."""
+    s = col.astype(str).str.strip().str.lower().str.replace(_WS_RE, " ", regex=True)
+    return s.where(col.notna() & (s != ""))
 
 
-def _parse_year_cell(value: object) -> int | None:
-    if value is None or (isinstance(value, float) and pd.isna(value)):
-        return None
-    s = str(value).strip()
-    if not s:
-        return None
-    s = re.sub(r"\([^)]*\)", "", s)  # remove footnote markers like "(2)"
-    m = re.search(r"\b(19\d{2}|20\d{2})\b", s)
-    if not m:
-        return None
-    return int(m.group(1))
-
-
-def _parse_period_label(value: object) -> str | None:
-    if value is None or (isinstance(value, float) and pd.isna(value)):
-        return None
-    s = str(value).strip().lower()
-    if not s:
-        return None
-    # normalize common variants
-    s = re.sub(r"\s+", " ", s)
-    return s
+def _year_cells(col: pd.Series) -> pd.Series:
+    """Year in each cell, ignoring footnote markers like "(2)"; cells without a year become NaN."""
+    s = col.astype(str).str.replace(_FOOTNOTE_RE, "", regex=True)
+    return pd.to_numeric(s.str.extract(_YEAR_RE, expand=False), errors="coerce")
 
 
 def _infer_area_from_sheet(sheet_name: str) -> str | None:
@@ -126,37 +122,23 @@ def _pick_zip_member(zf: zipfile.ZipFile) -> str | None:
     return sorted(members, key=score, reverse=True)[0]
 
 
-def _parse_timeseries_sheet(
-    *,
-    grid: pd.DataFrame,
-    sheet_name: str,
-) -> list[dict[str, Any]]:
-    """Parse a single INEC poverty workbook sheet into standardized rows.
-
-    Handles the common INEC format:
-    - Header row includes "Período" and a metric column (e.g., "Incidencia", "Índice de Gini")
-    - Data rows use a period label (e.g., "Junio", "Diciembre") with year in the next column
-      and the metric value in the metric column.
-    """
-
+def _sheet_kind(sheet_name: str) -> tuple[str, str, str] | None:
+    """Map a sheet name to ``(series_base, value_header_substr, unit)``, or None to skip it."""
     sheet_lower = sheet_name.lower().strip()
-    area = _infer_area_from_sheet(sheet_name)
-
     if "pobre_" in sheet_lower or ".pobre_" in sheet_lower:
-        series_base = "poverty_rate_pct"
-        value_header_substr = "incid"
-        unit = "%"
-    elif "extpob_" in sheet_lower or ".extpob_" in sheet_lower:
-        series_base = "extreme_poverty_rate_pct"
-        value_header_substr = "incid"
-        unit = "%"
-    elif "desigualdad" in sheet_lower:
-        series_base = "gini"
-        value_header_substr = "gini"
-        unit = "index"
-    else:
-        return []
+        return "poverty_rate_pct", "incid", "%"
+    if "extpob_" in sheet_lower or ".extpob_" in sheet_lower:
+        return "extreme_poverty_rate_pct", "incid", "%"
+    if "desigualdad" in sheet_lower:
+        return "gini", "gini", "index"
+    return None
+
 
+def _locate_columns(grid: pd.DataFrame, value_header_substr: str) -> tuple[int, int, int, int] | None:
+    """Find ``(header_row, period_col, year_col, value_col)``.
+
+    Only the first ``_HEAD_ROWS`` rows of the sheet are needed to decide this.
+    """
     # Find header row (the one containing "Período").
     header_row = None
     for i in range(min(80, len(grid))):
@@ -165,7 +147,7 @@ def _parse_timeseries_sheet(
             header_row = i
             break
     if header_row is None:
-        return []
+        return None
 
     header = grid.iloc[header_row].astype(str).str.strip().str.lower().tolist()
     period_col = None
@@ -174,7 +156,7 @@ def _parse_timeseries_sheet(
             period_col = j
             break
     if period_col is None:
-        return []
+        return None
 
     # Find value column by substring.
     value_col = None
@@ -183,93 +165,152 @@ def _parse_timeseries_sheet(
             value_col = j
             break
     if value_col is None:
-        return []
+        return None
 
     # Find year column: first column to the right of period_col with mostly year-like values.
     year_col = None
     candidate_cols = list(range(period_col + 1, min(period_col + 4, grid.shape[1])))
     for j in candidate_cols:
-        years = []
-        for v in grid.iloc[header_row + 1 : header_row + 40, j].tolist():
-            y = _parse_year_cell(v)
-            if y is not None:
-                years.append(y)
-        if len(years) >= 2:
+        if _year_cells(grid.iloc[header_row + 1 : header_row + 40, j]).notna().sum() >= 2:
             year_col = j
             break
     if year_col is None:
-        return []
-
-    rows: list[dict[str, Any]] = []
-    current_period_label: str | None = None
-
-    for i in range(header_row + 1, len(grid)):
-        period_label = _parse_period_label(grid.iat[i, period_col])
-        if period_label and (period_label.startswith("*") or period_label.startswith("fuente") or period_label.startswith("nota")):
-            break
-
-        if period_label:
-            current_period_label = period_label
+        return None
 
-        year = _parse_year_cell(grid.iat[i, year_col])
-        if year is None:
-            continue
+    return header_row, period_col, year_col, value_col
 
-        if not current_period_label:
-            continue
 
-        month = _SPANISH_MONTH.get(current_period_label.strip().lower())
-        if month is None:
-            # Some sheets use "Junio" and "Diciembre" only; ignore unknown labels.
-            continue
+def _parse_rows(
+    *,
+    period_cells: pd.Series,
+    year_cells: pd.Series,
+    value_cells: pd.Series,
+    series_base: str,
+    area: str | None,
+    unit: str,
+) -> pd.DataFrame:
+    labels = _period_labels(period_cells)
+
+    # Stop at footnotes / source notes below the table.
+    stop = labels.str.match(r"\*|fuente|nota", na=False).to_numpy()
+    end = int(stop.argmax()) if stop.any() else len(labels)
+
+    # Period labels are carried forward; unknown labels (not a Spanish month) are ignored.
+    months = labels.iloc[:end].ffill().map(_SPANISH_MONTH)
+    years = _year_cells(year_cells.iloc[:end])
+    values = parse_float_array(value_cells.iloc[:end])
+
+    ok = (months.notna() & years.notna() & values.notna()).to_numpy()
+    if not ok.any():
+        return pd.DataFrame()
+
+    period_date = pd.to_datetime(
+        pd.DataFrame({"year": years[ok].astype(int), "month": months[ok].astype(int), "day": 1})
+    ) + pd.offsets.MonthEnd(0)
+
+    out = pd.DataFrame(
+        {
+            "period_date": period_date.to_numpy(),
+            "period_grain": "month",
+            "series": f"{series_base}_{area}" if area else series_base,
+            "value": values[ok].to_numpy(),
+            "unit": unit,
+            "source": "INEC",
+        }
+    )
 
-        value = parse_float_maybe(grid.iat[i, value_col])
-        if value is None:
-            continue
+    # Add national alias without suffix for convenience.
+    if area == "national":
+        out = pd.concat([out, out.assign(series=series_base)], ignore_index=True)
 
-        series = series_base
-        if area:
-            series = f"{series_base}_{area}"
+    return out
 
-        rows.append(
-            {
-                "period_date": _month_end(year, month),
-                "period_grain": "month",
-                "series": series,
-                "value": float(value),
-                "unit": unit,
-                "source": "INEC",
-            }
-        )
 
-        # Add national alias without suffix for convenience.
-        if area == "national":
-            rows.append(
-                {
-                    "period_date": _month_end(year, month),
-                    "period_grain": "month",
-                    "series": series_base,
-                    "value": float(value),
-                    "unit": unit,
-                    "source": "INEC",
-                }
-            )
+def _parse_timeseries_sheet(
+    *,
+    grid: pd.DataFrame,
+    sheet_name: str,
+) -> pd.DataFrame:
+    """Parse a single INEC poverty workbook sheet into standardized rows.
 
-    return rows
+    Handles the common INEC format:
+    - Header row includes "Período" and a metric column (e.g., "Incidencia", "Índice de Gini")
+    - Data rows use a period label (e.g., "Junio", "Diciembre") with year in the next column
+      and the metric value in the metric column.
+    """
 
+    kind = _sheet_kind(sheet_name)
+    if kind is None:
+        return pd.DataFrame()
+    series_base, value_header_substr, unit = kind
+
+    layout = _locate_columns(grid, value_header_substr)
+    if layout is None:
+        return pd.DataFrame()
+    header_row, period_col, year_col, value_col = layout
+
+    block = grid.iloc[header_row + 1 :]
+    return _parse_rows(
+        period_cells=block.iloc[:, period_col],
+        year_cells=block.iloc[:, year_col],
+        value_cells=block.iloc[:, value_col],
+        series_base=series_base,
+        area=_infer_area_from_sheet(sheet_name),
+        unit=unit,
+    )
 
-def _parse_poverty_tables_from_excel(path: Path) -> pd.DataFrame:
-    xls = pd.ExcelFile(path)
-    rows: list[dict[str, Any]] = []
 
-    for sheet in xls.sheet_names:
-        # Read as raw grid so we can detect header rows robustly.
-        grid = pd.read_excel(xls, sheet_name=sheet, header=None)
-        if grid.empty or grid.shape[1] < 3:
-            continue
-        rows.extend(_parse_timeseries_sheet(grid=grid, sheet_name=sheet))
+def _parse_poverty_tables_from_excel(path: Path | IO[bytes]) -> pd.DataFrame:
+    # Read-only mode streams rows from the sheet XML; sheets we don't recognize are never read.
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    frames: list[pd.DataFrame] = []
+
+    try:
+        for ws in wb.worksheets:
+            kind = _sheet_kind(ws.title)
+            if kind is None:
+                continue
+            series_base, value_header_substr, unit = kind
+
+            # Don't trust the stored <dimension>: some exporters write "A1" for the whole sheet.
+            ws.reset_dimensions()
+            sheet_rows = ws.iter_rows(values_only=True)
+            head_rows = list(islice(sheet_rows, _HEAD_ROWS))
+            head = pd.DataFrame(head_rows)
+            if head.empty or head.shape[1] < 3:
+                continue
+
+            layout = _locate_columns(head, value_header_substr)
+            if layout is None:
+                continue
+            header_row, period_col, year_col, value_col = layout
+
+            # Keep only the three columns we parse from the remaining rows, column by column.
+            periods: list[object] = []
+            years: list[object] = []
+            values: list[object] = []
+            for r in chain(head_rows[header_row + 1 :], sheet_rows):
+                n = len(r)
+                periods.append(r[period_col] if period_col < n else None)
+                years.append(r[year_col] if year_col < n else None)
+                values.append(r[value_col] if value_col < n else None)
+            if not periods:
+                continue
+
+            parsed = _parse_rows(
+                period_cells=pd.Series(periods, dtype=object),
+                year_cells=pd.Series(years, dtype=object),
+                value_cells=pd.Series(values),
+                series_base=series_base,
+                area=_infer_area_from_sheet(ws.title),
+                unit=unit,
+            )
+            if not parsed.empty:
+                frames.append(parsed)
+    finally:
+        wb.close()
 
-    return pd.DataFrame(rows)
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
 
 
 def run_inec_poverty(settings: dict[str, Any], *, cache_dir: Path, force: bool = False) -> PovertyExtract:
@@ -285,19 +326,21 @@ def run_inec_poverty(settings: dict[str, Any], *, cache_dir: Path, force: bool =
     )
 
     include = re.compile(str(cfg.get("include_regex", "")))
-    urls: list[tuple[str, WpPost]] = []
+    # (post date, asset url, post); the date is precomputed as the sort key.
+    urls: list[tuple[str, str, WpPost]] = []
     for p in posts:
+        post_date = p.date or ""
         for u in extract_urls(p.content_html):
             if include.search(u):
-                urls.append((u, p))
+                urls.append((post_date, u, p))
 
     # Prefer newest posts first.
-    urls = sorted(urls, key=lambda t: (t[1].date or ""), reverse=True)
+    urls.sort(key=itemgetter(0), reverse=True)
 
     sources: list[dict[str, Any]] = []
     indicators_frames: list[pd.DataFrame] = []
 
-    for url, post in urls[: int(cfg.get("max_assets", 5))]:
+    for _, url, post in urls[: int(cfg.get("max_assets", 5))]:
         sources.append(
             {
                 "source": "INEC",
@@ -325,12 +368,12 @@ def run_inec_poverty(settings: dict[str, Any], *, cache_dir: Path, force: bool =
                 member = _pick_zip_member(zf)
                 if not member:
                     continue
-                extracted = zf.extract(member, path=cache_dir)
+                workbook = zf.read(member)
         except Exception:
             continue
 
         try:
-            parsed = _parse_poverty_tables_from_excel(Path(extracted))
+            parsed = _parse_poverty_tables_from_excel(io.BytesIO(workbook))
         except Exception:
             continue
 
@@ -340,8 +383,6 @@ def run_inec_poverty(settings: dict[str, Any], *, cache_dir: Path, force: bool =
 
     indicators = pd.concat(indicators_frames, ignore_index=True) if indicators_frames else pd.DataFrame()
     if not indicators.empty:
-        indicators["period_date"] = pd.to_datetime(indicators["period_date"]).dt.date
-        indicators = indicators.drop_duplicates(subset=["period_date", "series"], keep="last")
-        indicators = indicators.sort_values(["series", "period_date"])
+        indicators = keep_last_sorted(indicators, keys=["period_date", "series"], order_by=["series", "period_date"])
 
     return PovertyExtract(indicators=indicators, sources=sources)
@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+import asyncio
 import re
 from dataclasses import dataclass
+from itertools import chain
 from typing import Any, Iterable
 
 import httpx
 
+try:
+    import re2 as _url_re
+except ImportError:  # pragma: no cover - optional linear-time engine
+    _url_re = re
 
-@dataclass(frozen=True)
+from ec_poverty_monitor.util.http import async_http_client
+from ec_poverty_monitor.util.jsonio import loads
+
+
+@dataclass(frozen=True, slots=True)
 class WpPost:
     id: int
     date: str
@@ -16,11 +26,88 @@ class WpPost:
     content_html: str
 
 
-_URL_RE = re.compile(r"https?://[^\s\"']+")
+# Stops at whitespace, quotes and tag delimiters, so a URL never runs into the following markup.
+_URL_RE = _url_re.compile(r"https?://[^\s\"'<>]+")
 
 
 def extract_urls(html: str) -> list[str]:
-    return _URL_RE.findall(html or "")
+    if not html or "http" not in html:
+        return []
+    return _URL_RE.findall(html)
+
+
+def _page_items(resp: httpx.Response) -> list[dict[str, Any]]:
+    if resp.status_code == 400:
+        # Usually "rest_post_invalid_page_number".
+        return []
+    resp.raise_for_status()
+    return loads(resp.content)
+
+
+def _add_posts(by_id: dict[int, WpPost], data: list[dict[str, Any]]) -> None:
+    """Add page items to ``by_id``; the first occurrence of an id wins."""
+    for item in data:
+        pid = int(item["id"])
+        if pid in by_id:
+            continue
+        by_id[pid] = WpPost(
+            id=pid,
+            date=str(item.get("date", "")),
+            link=str(item.get("link", "")),
+            title=str((item.get("title") or {}).get("rendered", "")),
+            content_html=str((item.get("content") or {}).get("rendered", "")),
+        )
+
+
+async def _fetch_posts_async(
+    client: httpx.AsyncClient,
+    *,
+    base_url: str,
+    search: str,
+    per_page: int,
+    max_pages: int,
+) -> dict[int, WpPost]:
+    url = f"{base_url}/posts"
+    # Encode the fixed part of the query once; each page only sets its number.
+    base_params = httpx.QueryParams({"search": search, "per_page": per_page})
+
+    async def get_page(page: int) -> httpx.Response:
+        return await client.get(url, params=base_params.set("page", page))
+
+    first = await get_page(1)
+    data = _page_items(first)
+    if not data:
+        return {}
+    by_id: dict[int, WpPost] = {}
+    _add_posts(by_id, data)
+
+    try:
+        total_pages: int | None = int(first.headers["X-WP-TotalPages"])
+    except (KeyError, ValueError):
+        total_pages = None
+
+    if total_pages is None:
+        # No page count advertised: walk pages until one comes back empty.
+        for page in range(2, max_pages + 1):
+            data = _page_items(await get_page(page))
+            if not data:
+                break
+            _add_posts(by_id, data)
+        return by_id
+
+    # Page count known: fetch the remaining pages concurrently, then consume them in order.
+    responses = await asyncio.gather(
+        *(get_page(page) for page in range(2, min(total_pages, max_pages) + 1)),
+        return_exceptions=True,
+    )
+    for resp in responses:
+        if isinstance(resp, BaseException):
+            raise resp
+        data = _page_items(resp)
+        if not data:
+            break
+        _add_posts(by_id, data)
+    return by_id
 
 
 def fetch_posts(
@@ -32,42 +119,13 @@ def fetch_posts(
     timeout_s: float = 60,
     user_agent: str,
 ) -> list[WpPost]:
-    posts: list[WpPost] = []
-
-    headers = {"User-Agent": user_agent}
-    with httpx.Client(timeout=timeout_s, headers=headers, follow_redirects=True) as client:
-        for page in range(1, max_pages + 1):
-            url = f"{base_url}/posts"
-            params = {"search": search, "per_page": per_page, "page": page}
-            resp = client.get(url, params=params)
-            if resp.status_code == 400:
-                # Usually "rest_post_invalid_page_number".
-                break
-            resp.raise_for_status()
-            data: list[dict[str, Any]] = resp.json()
-            if not data:
-                break
-
-            for item in data:
-                posts.append(
-                    WpPost(
-                        id=int(item["id"]),
-                        date=str(item.get("date", "")),
-                        link=str(item.get("link", "")),
-                        title=str(item.get("title", {}).get("rendered", "")),
-                        content_html=str(item.get("content", {}).get("rendered", "")),
-                    )
-                )
+    async def run() -> dict[int, WpPost]:
+        async with async_http_client(user_agent=user_agent, timeout_s=timeout_s) as client:
+            return await _fetch_posts_async(
+                client, base_url=base_url, search=search, per_page=per_page, max_pages=max_pages
+            )
 
-    # Deduplicate by id.
-    seen: set[int] = set()
-    out: list[WpPost] = []
-    for p in posts:
-        if p.id in seen:
-            continue
-        seen.add(p.id)
-        out.append(p)
-    return out
+    return list(asyncio.run(run()).values())
 
 
 def fetch_posts_multi(
@@ -79,19 +137,18 @@ def fetch_posts_multi(
     timeout_s: float = 60,
     user_agent: str,
 ) -> list[WpPost]:
-    all_posts: list[WpPost] = []
-    for term in search_terms:
-        all_posts.extend(
-            fetch_posts(
-                base_url=base_url,
-                search=term,
-                per_page=per_page,
-                max_pages=max_pages,
-                timeout_s=timeout_s,
-                user_agent=user_agent,
+    # All search terms share one event loop and connection pool.
+    async def run() -> list[dict[int, WpPost]]:
+        async with async_http_client(user_agent=user_agent, timeout_s=timeout_s) as client:
+            return await asyncio.gather(
+                *(
+                    _fetch_posts_async(
+                        client, base_url=base_url, search=term, per_page=per_page, max_pages=max_pages
+                    )
+                    for term in search_terms
+                )
             )
-        )
 
-    # Deduplicate by id.
-    by_id: dict[int, WpPost] = {p.id: p for p in all_posts}
+    # Merge in search-term order: a later term's copy of a post replaces an earlier one.
+    by_id = dict(chain.from_iterable(term_posts.items() for term_posts in asyncio.run(run())))
     return list(by_id.values())
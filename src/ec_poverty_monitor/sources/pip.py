@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
 from dataclasses import dataclass
 from typing import Any
@@ -7,6 +8,8 @@ from typing import Any
 import httpx
 import pandas as pd
 
+from ec_poverty_monitor.util.http import async_client_or
+
 
 @dataclass(frozen=True)
 class PipExtract:
@@ -14,14 +17,15 @@ class PipExtract:
     sources: list[dict[str, Any]]
 
 
-def fetch_pip_year(*, base_url: str, country: str, year: int, user_agent: str) -> dict[str, Any] | None:
+async def fetch_pip_year(
+    client: httpx.AsyncClient, *, base_url: str, country: str, year: int
+) -> dict[str, Any] | None:
     params = {"country": country, "year": year, "format": "json"}
-    with httpx.Client(follow_redirects=True, timeout=60, headers={"User-Agent": user_agent}) as client:
-        resp = client.get(base_url, params=params)
-        if resp.status_code == 404:
-            return None
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await client.get(base_url, params=params)
+    if resp.status_code == 404:
+        return None
+    resp.raise_for_status()
+    data = resp.json()
 
     if isinstance(data, list) and len(data) >= 1 and isinstance(data[0], dict):
         return data[0]
@@ -30,53 +34,58 @@ def fetch_pip_year(*, base_url: str, country: str, year: int, user_agent: str) -
     return None
 
 
-def run_pip(settings: dict[str, Any], *, start_year: int = 2007) -> PipExtract:
+async def arun_pip(
+    settings: dict[str, Any], *, start_year: int = 2007, client: httpx.AsyncClient | None = None
+) -> PipExtract:
     cfg = settings["world_bank_pip"]
     user_agent = settings["inec_wp_api"].get("user_agent", "ec-pov-monitor")
 
-    current_year = dt.date.today().year
-    rows: list[dict[str, Any]] = []
+    years = range(start_year, dt.date.today().year + 1)
+
+    async with async_client_or(client, user_agent=user_agent) as c:
+        recs = await asyncio.gather(
+            *(fetch_pip_year(c, base_url=cfg["base_url"], country=cfg["country"], year=y) for y in years)
+        )
+
+    cols: dict[str, list[Any]] = {"period_date": [], "series": [], "value": [], "unit": [], "source_url": []}
+
+    def add(year: int, series: str, value: Any, unit: str) -> None:
+        cols["period_date"].append(pd.Timestamp(year, 12, 31))
+        cols["series"].append(series)
+        cols["value"].append(float(value))
+        cols["unit"].append(unit)
+        cols["source_url"].append(f"{cfg['base_url']}?country={cfg['country']}&year={year}&format=json")
 
-    for year in range(start_year, current_year + 1):
-        rec = fetch_pip_year(base_url=cfg["base_url"], country=cfg["country"], year=year, user_agent=user_agent)
+    for year, rec in zip(years, recs):
         if not rec:
             continue
 
-        period_date = dt.date(year, 12, 31)
-
         # Always keep gini if present.
         if rec.get("gini") is not None:
-            rows.append(
-                {
-                    "period_date": period_date,
-                    "period_grain": "year",
-                    "series": "gini",
-                    "value": float(rec["gini"]),
-                    "unit": "index",
-                    "source": "PIP",
-                    "source_url": f"{cfg['base_url']}?country={cfg['country']}&year={year}&format=json",
-                }
-            )
+            add(year, "gini", rec["gini"], "index")
 
         # Headcount: PIP values depend on which poverty line record is returned.
         # If headcount exists in the record, store it but label as generic.
         if rec.get("headcount") is not None:
-            rows.append(
-                {
-                    "period_date": period_date,
-                    "period_grain": "year",
-                    "series": "poverty_headcount" ,
-                    "value": float(rec["headcount"]),
-                    "unit": "%",
-                    "source": "PIP",
-                    "source_url": f"{cfg['base_url']}?country={cfg['country']}&year={year}&format=json",
-                }
-            )
-
-    out = pd.DataFrame(rows)
-    if not out.empty:
-        out["period_date"] = pd.to_datetime(out["period_date"]).dt.date
-        out = out.sort_values(["series", "period_date"])
+            add(year, "poverty_headcount", rec["headcount"], "%")
+
+    out = pd.DataFrame()
+    if cols["series"]:
+        out = pd.DataFrame(
+            {
+                "period_date": pd.DatetimeIndex(cols["period_date"]),
+                "period_grain": "year",
+                "series": cols["series"],
+                "value": cols["value"],
+                "unit": cols["unit"],
+                "source": "PIP",
+                "source_url": cols["source_url"],
+            }
+        ).sort_values(["series", "period_date"])
 
     sources = [{"source": "PIP", "base_url": cfg["base_url"], "country": cfg["country"], "start_year": start_year}]
     return PipExtract(indicators=out, sources=sources)
+
+
+def run_pip(settings: dict[str, Any], *, start_year: int = 2007) -> PipExtract:
+    return asyncio.run(arun_pip(settings, start_year=start_year))
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import datetime as dt
+import asyncio
 from dataclasses import dataclass
 from typing import Any
 
 import httpx
 import pandas as pd
 
+from ec_poverty_monitor.util.http import async_client_or
+
 
 @dataclass(frozen=True)
 class WdiExtract:
@@ -14,14 +16,15 @@ class WdiExtract:
     sources: list[dict[str, Any]]
 
 
-def fetch_wdi_indicator(*, base_url: str, country: str, indicator: str, user_agent: str) -> pd.DataFrame:
+async def fetch_wdi_indicator(
+    client: httpx.AsyncClient, *, base_url: str, country: str, indicator: str
+) -> pd.DataFrame:
     url = f"{base_url}/country/{country}/indicator/{indicator}"
     params = {"format": "json", "per_page": 20000}
 
-    with httpx.Client(follow_redirects=True, timeout=60, headers={"User-Agent": user_agent}) as client:
-        resp = client.get(url, params=params)
-        resp.raise_for_status()
-        payload = resp.json()
+    resp = await client.get(url, params=params)
+    resp.raise_for_status()
+    payload = resp.json()
 
     if not isinstance(payload, list) or len(payload) < 2:
         return pd.DataFrame()
@@ -40,49 +43,55 @@ def fetch_wdi_indicator(*, base_url: str, country: str, indicator: str, user_age
         return df
 
     df = df.sort_values("year")
-    df["period_date"] = df["year"].apply(lambda y: dt.date(y, 12, 31))
+    df["period_date"] = pd.to_datetime(df["year"].astype(str) + "-12-31")
     df["period_grain"] = "year"
     return df[["period_date", "period_grain", "value"]]
 
 
-def run_wdi(settings: dict[str, Any], country: str) -> WdiExtract:
+async def arun_wdi(
+    settings: dict[str, Any], country: str, *, client: httpx.AsyncClient | None = None
+) -> WdiExtract:
     cfg = settings["world_bank_wdi"]
     user_agent = settings["inec_wp_api"].get("user_agent", "ec-pov-monitor")
 
-    rows: list[dict[str, Any]] = []
+    indicators: dict[str, str] = cfg.get("indicators", {})
+
+    async with async_client_or(client, user_agent=user_agent) as c:
+        results = await asyncio.gather(
+            *(
+                fetch_wdi_indicator(c, base_url=cfg["base_url"], country=country, indicator=code)
+                for code in indicators.values()
+            )
+        )
+
+    frames: list[pd.DataFrame] = []
     sources: list[dict[str, Any]] = []
 
-    for series, indicator_code in cfg.get("indicators", {}).items():
-        df = fetch_wdi_indicator(base_url=cfg["base_url"], country=country, indicator=indicator_code, user_agent=user_agent)
+    for (series, indicator_code), df in zip(indicators.items(), results):
         if df.empty:
             continue
 
+        url = f"{cfg['base_url']}/country/{country}/indicator/{indicator_code}?format=json"
         unit = "%" if series.endswith("_pct") else "USD"
-
-        for _, r in df.iterrows():
-            rows.append(
-                {
-                    "period_date": r["period_date"],
-                    "period_grain": r["period_grain"],
-                    "series": series,
-                    "value": float(r["value"]),
-                    "unit": unit,
-                    "source": "WDI",
-                    "source_url": f"{cfg['base_url']}/country/{country}/indicator/{indicator_code}?format=json",
-                }
-            )
+        frames.append(
+            df.assign(series=series, unit=unit, source="WDI", source_url=url)[
+                ["period_date", "period_grain", "series", "value", "unit", "source", "source_url"]
+            ]
+        )
 
         sources.append(
             {
                 "source": "WDI",
                 "indicator": indicator_code,
                 "series": series,
-                "url": f"{cfg['base_url']}/country/{country}/indicator/{indicator_code}?format=json",
+                "url": url,
             }
         )
 
-    out = pd.DataFrame(rows)
-    if not out.empty:
-        out["period_date"] = pd.to_datetime(out["period_date"]).dt.date
+    out = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
 
     return WdiExtract(indicators=out, sources=sources)
+
+
+def run_wdi(settings: dict[str, Any], country: str) -> WdiExtract:
+    return asyncio.run(arun_wdi(settings, country))
@@ -2,11 +2,19 @@ from __future__ import annotations
 
 import datetime as dt
 from dataclasses import dataclass
+from itertools import chain
 from typing import Any
 
 import duckdb
 import pandas as pd
 
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - pyarrow normally comes with streamlit
+    pa = None
+
+_PARQUET_OPTIONS = "FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE 122880"
+
 
 @dataclass(frozen=True)
 class MartResult:
@@ -15,33 +23,20 @@ class MartResult:
     duckdb_path: str
 
 
-def _to_quarter_end(d: dt.date) -> dt.date:
-    q = (d.month - 1) // 3 + 1
-    if q == 1:
-        return dt.date(d.year, 3, 31)
-    if q == 2:
-        return dt.date(d.year, 6, 30)
-    if q == 3:
-        return dt.date(d.year, 9, 30)
-    return dt.date(d.year, 12, 31)
-
-
-def apply_comparability_break(
+def enrich(
     df: pd.DataFrame,
     *,
     start: dt.date,
     end: dt.date,
 ) -> pd.DataFrame:
-    out = df.copy()
-    out["comparability_break"] = out["period_date"].apply(lambda d: start <= d <= end)
-    return out
-
-
-def canonicalize_period(df: pd.DataFrame) -> pd.DataFrame:
-    out = df.copy()
-    out["period_date"] = pd.to_datetime(out["period_date"]).dt.date
-    out["canonical_period_date"] = out["period_date"].apply(_to_quarter_end)
-    return out
+    """Add ``canonical_period_date`` and the ``comparability_break`` flag in a single copy."""
+    dates = pd.to_datetime(df["period_date"])
+    return df.assign(
+        period_date=dates,
+        # QuarterEnd(0) leaves dates already on a quarter end in place.
+        canonical_period_date=(dates + pd.offsets.QuarterEnd(0)).dt.date,
+        comparability_break=dates.between(pd.Timestamp(start), pd.Timestamp(end)),
+    )
 
 
 def build_duckdb_and_parquet(
@@ -51,21 +46,35 @@ def build_duckdb_and_parquet(
     duckdb_path: str,
     indicators_parquet: str,
     sources_parquet: str,
+    create_tables: bool = True,
 ) -> MartResult:
     con = duckdb.connect(duckdb_path)
 
-    con.register("indicators", indicators)
-    con.register("sources", sources)
-
-    con.execute("CREATE OR REPLACE TABLE mart_indicators AS SELECT * FROM indicators")
-    con.execute("CREATE OR REPLACE TABLE mart_sources AS SELECT * FROM sources")
+    projections: dict[str, str] = {}
+    for name, df in (("indicators", indicators), ("sources", sources)):
+        # Convert to Arrow once so the CREATE and COPY scans reuse the same buffers.
+        con.register(name, pa.Table.from_pandas(df, preserve_index=False) if pa is not None else df)
+        # Arrow dictionaries scan as VARCHAR, so the mart schema comes from the pandas frame,
+        # which keeps categoricals as ENUMs.
+        con.register(f"{name}_schema", df)
+        # period_date is datetime64 in pandas but a calendar date in the marts, like
+        # canonical_period_date.
+        projections[name] = (
+            "* REPLACE (CAST(period_date AS DATE) AS period_date)" if "period_date" in df.columns else "*"
+        )
+
+    # The dashboard queries the mart tables; parquet-only callers can skip materializing them.
+    if create_tables:
+        for name, cols in projections.items():
+            con.execute(f"CREATE OR REPLACE TABLE mart_{name} AS SELECT {cols} FROM {name}_schema LIMIT 0")
+            con.execute(f"INSERT INTO mart_{name} SELECT {cols} FROM {name}")
 
     con.execute(
-        "COPY mart_indicators TO ? (FORMAT PARQUET)",
+        f"COPY (SELECT {projections['indicators']} FROM indicators) TO ? ({_PARQUET_OPTIONS})",
         [indicators_parquet],
     )
     con.execute(
-        "COPY mart_sources TO ? (FORMAT PARQUET)",
+        f"COPY (SELECT {projections['sources']} FROM sources) TO ? ({_PARQUET_OPTIONS})",
         [sources_parquet],
     )
 
@@ -75,7 +84,4 @@ def build_duckdb_and_parquet(
 
 
 def stack_sources(source_lists: list[list[dict[str, Any]]]) -> pd.DataFrame:
-    rows: list[dict[str, Any]] = []
-    for lst in source_lists:
-        rows.extend(lst)
-    return pd.DataFrame(rows)
+    return pd.DataFrame.from_records(chain.from_iterable(source_lists))
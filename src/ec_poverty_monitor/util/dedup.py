@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import duckdb
+import numpy as np
+import pandas as pd
+
+
+def keep_last_sorted(df: pd.DataFrame, *, keys: list[str], order_by: list[str]) -> pd.DataFrame:
+    """Keep the last row (in frame order) per ``keys`` and sort by ``order_by``.
+
+    Equivalent to ``drop_duplicates(keep="last").sort_values(...)`` but runs in DuckDB.
+    """
+    partition = ", ".join(f'"{k}"' for k in keys)
+    order = ", ".join(f'"{c}"' for c in order_by)
+
+    con = duckdb.connect(":memory:")
+    try:
+        con.register("raw", df.assign(_row=np.arange(len(df))))
+        out = con.execute(
+            f"""
+            SELECT * EXCLUDE (_row)
+            FROM raw
+            QUALIFY row_number() OVER (PARTITION BY {partition} ORDER BY _row DESC) = 1
+            ORDER BY {order}
+            """
+        ).df()
+    finally:
+        con.close()
+    return out
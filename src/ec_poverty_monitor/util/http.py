@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import atexit
+import functools
 import hashlib
 import json
+from contextlib import AbstractAsyncContextManager, nullcontext
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import httpx
 
+_CHUNK_SIZE = 64 * 1024
+
 
 @dataclass(frozen=True)
 class Downloaded:
@@ -18,12 +23,40 @@ class Downloaded:
     response_headers: dict[str, str]
 
 
-def _hash_url(url: str) -> str:
-    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+@functools.lru_cache(maxsize=None)
+def get_http_client(user_agent: str, timeout_s: float = 60) -> httpx.Client:
+    """Shared keep-alive client per (user agent, timeout), closed at interpreter exit."""
+    client = httpx.Client(
+        follow_redirects=True,
+        timeout=timeout_s,
+        headers={"User-Agent": user_agent},
+        limits=httpx.Limits(max_keepalive_connections=32),
+    )
+    atexit.register(client.close)
+    return client
+
+
+def async_http_client(*, user_agent: str, timeout_s: float = 60) -> httpx.AsyncClient:
+    # Async clients are tied to the event loop they run on, so they are created per run, not cached.
+    return httpx.AsyncClient(
+        timeout=timeout_s,
+        headers={"User-Agent": user_agent},
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=16),
+    )
 
 
-def _sha256_bytes(data: bytes) -> str:
-    return hashlib.sha256(data).hexdigest()
+def async_client_or(
+    client: httpx.AsyncClient | None, *, user_agent: str, timeout_s: float = 60
+) -> AbstractAsyncContextManager[httpx.AsyncClient]:
+    """Use ``client`` as-is (left open on exit) or open a new one for the ``async with`` block."""
+    if client is not None:
+        return nullcontext(client)
+    return async_http_client(user_agent=user_agent, timeout_s=timeout_s)
+
+
+def _hash_url(url: str) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
 
 
 def download(
@@ -33,38 +66,68 @@ def download(
     user_agent: str,
     timeout_s: float = 60,
     force: bool = False,
+    client: httpx.Client | None = None,
 ) -> Downloaded:
     out_dir.mkdir(parents=True, exist_ok=True)
     key = _hash_url(url)
     bin_path = out_dir / f"{key}.bin"
     meta_path = out_dir / f"{key}.json"
 
+    request_headers: dict[str, str] = {}
+    cached: Downloaded | None = None
     if bin_path.exists() and meta_path.exists() and not force:
         meta = json.loads(meta_path.read_text())
-        return Downloaded(
+        cached = Downloaded(
             url=url,
             path=bin_path,
             bytes=int(meta["bytes"]),
             sha256=str(meta["sha256"]),
             response_headers=dict(meta.get("response_headers", {})),
         )
+        # Revalidate with the stored validators; without any, trust the cache as before.
+        etag = cached.response_headers.get("etag")
+        last_modified = cached.response_headers.get("last-modified")
+        if etag is None and last_modified is None:
+            return cached
+        if etag is not None:
+            request_headers["If-None-Match"] = etag
+        if last_modified is not None:
+            request_headers["If-Modified-Since"] = last_modified
 
-    headers = {"User-Agent": user_agent}
-    with httpx.Client(follow_redirects=True, timeout=timeout_s, headers=headers) as client:
-        resp = client.get(url)
-        resp.raise_for_status()
+    # Stream the body to disk and hash it as it arrives instead of holding it in memory.
+    # A partial file never replaces a good cached copy.
+    h = hashlib.sha256()
+    part_path = bin_path.with_suffix(".part")
+    if client is None:
+        client = get_http_client(user_agent, timeout_s)
+    try:
+        with client.stream("GET", url, headers=request_headers) as resp:
+            if cached is not None and resp.status_code == 304:
+                return cached
+            resp.raise_for_status()
+            with part_path.open("wb") as f:
+                for chunk in resp.iter_bytes(_CHUNK_SIZE):
+                    h.update(chunk)
+                    f.write(chunk)
+    except (httpx.TransportError, httpx.HTTPStatusError):
+        # A failed revalidation (offline, outage, rate limiting, a moved or blocked file)
+        # falls back to the cached copy, as the cache was served before revalidation existed.
+        if cached is None:
+            raise
+        part_path.unlink(missing_ok=True)
+        return cached
+    part_path.replace(bin_path)
 
-    content = resp.content
-    sha = _sha256_bytes(content)
-    bin_path.write_bytes(content)
+    sha = h.hexdigest()
+    size = bin_path.stat().st_size
 
     response_headers = {k: v for k, v in resp.headers.items()}
     meta: dict[str, Any] = {
         "url": url,
-        "bytes": len(content),
+        "bytes": size,
         "sha256": sha,
         "response_headers": response_headers,
     }
     meta_path.write_text(json.dumps(meta, indent=2, ensure_ascii=False))
 
-    return Downloaded(url=url, path=bin_path, bytes=len(content), sha256=sha, response_headers=response_headers)
+    return Downloaded(url=url, path=bin_path, bytes=size, sha256=sha, response_headers=response_headers)
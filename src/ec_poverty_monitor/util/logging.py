@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
 
 from ec_poverty_monitor.settings import Settings
 
+_LOG_MAX_BYTES = 5 * 1024 * 1024
+_LOG_BACKUPS = 3
+
 
 def configure_logging(settings: Settings) -> logging.Logger:
     logger = logging.getLogger("ec_poverty_monitor")
@@ -20,10 +26,17 @@ def configure_logging(settings: Settings) -> logging.Logger:
     sh = logging.StreamHandler()
     sh.setFormatter(fmt)
 
-    fh = logging.FileHandler(log_path)
+    fh = logging.handlers.RotatingFileHandler(
+        log_path, maxBytes=_LOG_MAX_BYTES, backupCount=_LOG_BACKUPS
+    )
     fh.setFormatter(fmt)
 
-    logger.addHandler(sh)
-    logger.addHandler(fh)
+    # Callers only enqueue records; a listener thread does the console and file writes.
+    q: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(q, sh, fh, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    logger.addHandler(logging.handlers.QueueHandler(q))
 
     return logger
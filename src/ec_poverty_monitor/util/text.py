@@ -2,6 +2,13 @@ from __future__ import annotations
 
 import re
 
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+_SENTINELS = frozenset({"", "-", "—", "..", "…"})
+_THOUSANDS_RE = re.compile(r"\d\.\d{3}(?:\D|$)")
+_NUMBER_RE = re.compile(r"(-?\d+(?:\.\d+)?)")
+
 
 def parse_float_maybe(value: object) -> float | None:
     if value is None:
@@ -10,15 +17,34 @@ def parse_float_maybe(value: object) -> float | None:
         return float(value)
 
     s = str(value).strip()
-    if s in {"", "-", "—", "..", "…"}:
+    if s in _SENTINELS:
         return None
 
     # Remove thousands separators and normalize decimal comma.
     s = s.replace("\u00a0", " ")
-    s = s.replace(".", "") if re.search(r"\d\.\d{3}(\D|$)", s) else s
+    s = s.replace(".", "") if _THOUSANDS_RE.search(s) else s
     s = s.replace(",", ".")
 
-    m = re.search(r"-?\d+(?:\.\d+)?", s)
+    m = _NUMBER_RE.search(s)
     if not m:
         return None
     return float(m.group(0))
+
+
+def parse_float_array(values: pd.Series) -> pd.Series:
+    """Vectorized ``parse_float_maybe`` over a Series; unparseable cells become NaN."""
+    if is_numeric_dtype(values):
+        return values.astype(float)
+
+    is_str = values.map(type).eq(str)
+    out = pd.Series(float("nan"), index=values.index)
+    if is_str.any():
+        s = values[is_str].astype(str)
+        s = s.mask(s.str.contains(_THOUSANDS_RE), s.str.replace(".", "", regex=False))
+        s = s.str.replace(",", ".", regex=False)
+        out[is_str] = pd.to_numeric(s.str.extract(_NUMBER_RE, expand=False), errors="coerce")
+    other = ~is_str & values.notna()
+    if other.any():
+        # Numbers and the odd non-text cell (e.g. a date) take the scalar path.
+        out[other] = values[other].map(parse_float_maybe).astype(float)
+    return out
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import re
+
 import pandas as pd
 
+_BOUNDED_SERIES_RE = re.compile(r"rate|headcount", re.IGNORECASE)
+
 
 def validate_indicators(df: pd.DataFrame) -> list[str]:
     issues: list[str] = []
@@ -18,14 +22,16 @@ def validate_indicators(df: pd.DataFrame) -> list[str]:
     if dup:
         issues.append(f"duplicate (period_date, series, source) rows: {dup}")
 
-    pct = df[df["unit"] == "%"].copy()
-    if not pct.empty and "series" in pct.columns:
+    if "series" in df.columns:
         # Only enforce 0–100 for percentages that are rates/headcounts.
         # Percent-change series (e.g., growth) can legitimately be negative.
-        bounded = pct[pct["series"].astype(str).str.contains(r"(?:rate|headcount)", case=False, regex=True)]
-        if not bounded.empty:
-            bad = bounded[(bounded["value"] < 0) | (bounded["value"] > 100)]
-            if not bad.empty:
-                issues.append(f"rate/headcount percent values out of bounds: {len(bad)}")
+        # Masks only: no filtered copies, and for categorical series the regex runs once per category.
+        bounded = (df["unit"] == "%").to_numpy() & df["series"].str.contains(
+            _BOUNDED_SERIES_RE, na=False
+        ).to_numpy(dtype=bool)
+        values = df["value"].to_numpy(dtype=float)
+        bad = int((bounded & ((values < 0) | (values > 100))).sum())
+        if bad:
+            issues.append(f"rate/headcount percent values out of bounds: {bad}")
 
     return issues
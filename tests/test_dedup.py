@@ -0,0 +1,24 @@
+import pandas as pd
+
+from ec_poverty_monitor.util.dedup import keep_last_sorted
+
+
+def test_keep_last_sorted_last_duplicate_wins_and_output_is_sorted() -> None:
+    df = pd.DataFrame(
+        {
+            "period_date": pd.to_datetime(["2021-03-31", "2020-12-31", "2021-03-31", "2020-12-31"]),
+            "series": ["b", "a", "b", "b"],
+            "value": [1.0, 2.0, 3.0, 4.0],
+            "source_url": ["old", "x", "new", "y"],
+        }
+    )
+
+    out = keep_last_sorted(df, keys=["period_date", "series"], order_by=["series", "period_date"])
+
+    expected = (
+        df.drop_duplicates(subset=["period_date", "series"], keep="last")
+        .sort_values(["series", "period_date"])
+        .reset_index(drop=True)
+    )
+    pd.testing.assert_frame_equal(out, expected)
+    assert out["source_url"].tolist() == ["x", "y", "new"]
@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import httpx
+import pytest
+
+from ec_poverty_monitor.util.http import download
+
+URL = "https://example.org/Tabulados_pobreza.zip"
+
+
+def _client(handler) -> httpx.Client:
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def _seed_cache(tmp_path: Path) -> None:
+    def ok(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"v1", headers={"ETag": '"v1"'})
+
+    download(url=URL, out_dir=tmp_path, user_agent="test", client=_client(ok))
+
+
+def test_download_revalidates_with_etag_and_keeps_cache_on_304(tmp_path: Path) -> None:
+    _seed_cache(tmp_path)
+    seen: list[str | None] = []
+
+    def not_modified(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("If-None-Match"))
+        return httpx.Response(304)
+
+    dl = download(url=URL, out_dir=tmp_path, user_agent="test", client=_client(not_modified))
+    assert seen == ['"v1"']
+    assert dl.path.read_bytes() == b"v1"
+    assert dl.bytes == 2
+
+
+def test_download_replaces_cache_on_200(tmp_path: Path) -> None:
+    _seed_cache(tmp_path)
+
+    def changed(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=b"v2-body", headers={"ETag": '"v2"'})
+
+    dl = download(url=URL, out_dir=tmp_path, user_agent="test", client=_client(changed))
+    assert dl.path.read_bytes() == b"v2-body"
+    assert dl.bytes == 7
+    assert dl.response_headers["etag"] == '"v2"'
+
+
+def _unreachable(request: httpx.Request) -> httpx.Response:
+    raise httpx.ConnectError("unreachable", request=request)
+
+
+@pytest.mark.parametrize(
+    "handler",
+    [
+        lambda request: httpx.Response(503),
+        lambda request: httpx.Response(429),
+        lambda request: httpx.Response(404),
+        _unreachable,
+    ],
+    ids=["server-error", "rate-limited", "not-found", "connect-error"],
+)
+def test_download_falls_back_to_cache_when_revalidation_fails(tmp_path: Path, handler) -> None:
+    _seed_cache(tmp_path)
+    dl = download(url=URL, out_dir=tmp_path, user_agent="test", client=_client(handler))
+    assert dl.path.read_bytes() == b"v1"
+    assert not list(tmp_path.glob("*.part"))
+
+
+def test_download_without_cache_raises_on_error(tmp_path: Path) -> None:
+    with pytest.raises(httpx.HTTPStatusError):
+        download(
+            url=URL,
+            out_dir=tmp_path,
+            user_agent="test",
+            client=_client(lambda request: httpx.Response(503)),
+        )
@@ -0,0 +1,76 @@
+import pandas as pd
+
+from ec_poverty_monitor.sources.inec_labor import _find_indicator_table, _table_to_long
+
+_THEAD_HTML = """
+<table>
+  <thead>
+    <tr><th colspan="3">Indicadores ENEMDU</th></tr>
+    <tr><th>Indicador</th><th>oct-24</th><th>Oct – 2025</th></tr>
+  </thead>
+  <tbody>
+    <tr><td>Tasa de desempleo (%)</td><td>3,8%</td><td>3,2%</td></tr>
+    <tr><td>Tasa de empleo adecuado (%)</td><td>33,5</td><td>-</td></tr>
+  </tbody>
+</table>
+"""
+
+_PLAIN_HTML = """
+<table><tr><td>Otro</td><td>x</td></tr></table>
+<table>
+  <tr><td>Indicador</td><td>sep-25</td></tr>
+  <tr><td>Tasa de desempleo</td><td>3.5</td></tr>
+  <tr><td>Tasa de empleo adecuado</td><td>35,1</td></tr>
+  <tr><td>Tasa de subempleo</td><td>1.234,5</td></tr>
+</table>
+"""
+
+_TWO_LEVEL_HEADER_HTML = """
+<table>
+  <tr><th rowspan="2">Indicador</th><th colspan="2">Septiembre</th></tr>
+  <tr><th>sep-24</th><th>sep-25</th></tr>
+  <tr><td>Tasa de desempleo</td><td>3,3</td><td>3,7</td></tr>
+  <tr><td>Tasa de empleo adecuado</td><td>35,0</td><td>36,1</td></tr>
+</table>
+"""
+
+
+def _long(html: str) -> set[tuple[str, pd.Timestamp, float]]:
+    table = _find_indicator_table(html)
+    assert table is not None
+    long = _table_to_long(table)
+    return set(zip(long["series"], long["period_date"], long["value"]))
+
+
+def test_thead_header_found_below_colspan_title_row() -> None:
+    table = _find_indicator_table(_THEAD_HTML)
+    assert table is not None
+    # The colspan title row is expanded but skipped; the header is the first row with periods.
+    assert list(table.columns) == ["Indicador", "oct-24", "Oct – 2025"]
+
+
+def test_decimal_comma_percent_values_parse_as_decimals() -> None:
+    rows = _long(_THEAD_HTML)
+    assert ("unemployment_rate_pct", pd.Timestamp("2024-10-31"), 3.8) in rows
+    assert ("unemployment_rate_pct", pd.Timestamp("2025-10-31"), 3.2) in rows
+    assert ("adequate_employment_rate_pct", pd.Timestamp("2024-10-31"), 33.5) in rows
+    # "-" is a missing value, not a zero.
+    assert not any(s == "adequate_employment_rate_pct" and d.year == 2025 for s, d, _ in rows)
+
+
+def test_tbody_less_table_skips_non_indicator_tables() -> None:
+    rows = _long(_PLAIN_HTML)
+    assert rows == {
+        ("unemployment_rate_pct", pd.Timestamp("2025-09-30"), 3.5),
+        ("adequate_employment_rate_pct", pd.Timestamp("2025-09-30"), 35.1),
+        ("underemployment_rate_pct", pd.Timestamp("2025-09-30"), 1234.5),
+    }
+
+
+def test_rowspan_header_cells_are_carried_down() -> None:
+    table = _find_indicator_table(_TWO_LEVEL_HEADER_HTML)
+    assert table is not None
+    assert list(table.columns) == ["Indicador", "sep-24", "sep-25"]
+    rows = _long(_TWO_LEVEL_HEADER_HTML)
+    assert ("unemployment_rate_pct", pd.Timestamp("2024-09-30"), 3.3) in rows
+    assert ("unemployment_rate_pct", pd.Timestamp("2025-09-30"), 3.7) in rows
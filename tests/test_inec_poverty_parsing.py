@@ -1,6 +1,15 @@
+import re
+import zipfile
+from pathlib import Path
+
+import openpyxl
 import pandas as pd
+import pytest
 
-from ec_poverty_monitor.sources.inec_poverty import _parse_timeseries_sheet
+from ec_poverty_monitor.sources.inec_poverty import (
+    _parse_poverty_tables_from_excel,
+    _parse_timeseries_sheet,
+)
 
 
 def test_parse_timeseries_sheet_poverty_incidence_month_end_and_carry_forward() -> None:
@@ -15,13 +24,50 @@ def test_parse_timeseries_sheet_poverty_incidence_month_end_and_carry_forward()
         ]
     )
 
-    rows = _parse_timeseries_sheet(grid=grid, sheet_name="1.1.1.pobre_nacional")
+    rows = _parse_timeseries_sheet(grid=grid, sheet_name="1.1.1.pobre_nacional").to_dict("records")
     # Includes national alias (no suffix) and national-suffixed.
     assert any(r["series"] == "poverty_rate_pct_national" for r in rows)
     assert any(r["series"] == "poverty_rate_pct" for r in rows)
 
     # Check that month-end dates are correct.
     dates = {(r["series"], r["period_date"], r["value"]) for r in rows}
-    assert ("poverty_rate_pct", pd.Timestamp("2008-06-30").date(), 34.97) in dates
-    assert ("poverty_rate_pct", pd.Timestamp("2009-06-30").date(), 33.01) in dates
-    assert ("poverty_rate_pct", pd.Timestamp("2008-12-31").date(), 36.74) in dates
+    assert ("poverty_rate_pct", pd.Timestamp("2008-06-30"), 34.97) in dates
+    assert ("poverty_rate_pct", pd.Timestamp("2009-06-30"), 33.01) in dates
+    assert ("poverty_rate_pct", pd.Timestamp("2008-12-31"), 36.74) in dates
+
+
+def _write_workbook(path: Path, *, bad_dimension: bool) -> None:
+    wb = openpyxl.Workbook()
+    wb.remove(wb.active)
+    sheets = (("1.1.1.pobre_nacional", "Incidencia (1)"), ("2.desigualdad_urbana", "Índice de Gini"))
+    for name, header in sheets:
+        ws = wb.create_sheet(name)
+        ws.append([None, "Período", None, header])
+        ws.append([None, "Junio", 2008, 34.97])
+        ws.append([None, None, "2009 (2)", 33.01])
+        ws.append([None, "Diciembre", 2008, 36.74])
+    wb.save(path)
+
+    if bad_dimension:
+        # Mimic exporters that store a wrong <dimension ref="A1"/> in every sheet.
+        tmp = path.with_suffix(".tmp")
+        with zipfile.ZipFile(path) as src, zipfile.ZipFile(tmp, "w") as dst:
+            for item in src.infolist():
+                data = src.read(item.filename)
+                if item.filename.startswith("xl/worksheets/"):
+                    data = re.sub(rb'<dimension ref="[^"]*"', b'<dimension ref="A1"', data)
+                dst.writestr(item, data)
+        tmp.replace(path)
+
+
+@pytest.mark.parametrize("bad_dimension", [False, True], ids=["dimension-ok", "dimension-a1"])
+def test_parse_poverty_tables_from_excel(tmp_path: Path, bad_dimension: bool) -> None:
+    path = tmp_path / "tabulados.xlsx"
+    _write_workbook(path, bad_dimension=bad_dimension)
+
+    df = _parse_poverty_tables_from_excel(path)
+
+    rows = set(zip(df["series"], df["period_date"], df["value"]))
+    assert ("poverty_rate_pct", pd.Timestamp("2009-06-30"), 33.01) in rows
+    assert ("poverty_rate_pct", pd.Timestamp("2008-12-31"), 36.74) in rows
+    assert ("gini_urban", pd.Timestamp("2008-06-30"), 34.97) in rows
@@ -0,0 +1,29 @@
+import datetime as dt
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ec_poverty_monitor.util.text import parse_float_array, parse_float_maybe
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        pytest.param(["", "-", "—", "..", "…", "  "], id="sentinels"),
+        pytest.param(["1.234", "1.234,5", "1.234.567", "12.5", "12.3456"], id="thousands"),
+        pytest.param(["3,8", " 3,1 ", "3,8%", "x 4,2%", "0,5*", "-3.5"], id="decimal-comma"),
+        pytest.param([None, np.nan, "abc", None], id="missing"),
+        pytest.param([5, 2.5, "7,25", None, True, dt.datetime(2020, 1, 1)], id="mixed-object"),
+        pytest.param([1, 2, 3], id="ints-as-object"),
+    ],
+)
+def test_parse_float_array_matches_scalar_parser(values: list[object]) -> None:
+    col = pd.Series(values, dtype=object)
+    expected = pd.Series([parse_float_maybe(v) for v in values], dtype=float)
+    pd.testing.assert_series_equal(parse_float_array(col), expected)
+
+
+def test_parse_float_array_numeric_dtype_passthrough() -> None:
+    col = pd.Series([1, 2, 3])
+    pd.testing.assert_series_equal(parse_float_array(col), col.astype(float))